@@ -4,10 +4,12 @@ import os
 import json
 import time
 import logging
-from typing import List, Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Optional, Any
 from dataclasses import dataclass
 
 import gspread
+from gspread.utils import absolute_range_name, fill_gaps, rowcol_to_a1
 from google.oauth2.service_account import Credentials
 import pandas as pd
 
@@ -37,6 +39,8 @@ class GoogleSheetsManager:
         self.config = config
         self.client = self._setup_client()
         self.logger = self._setup_logger()
+        self._response_book: Optional[gspread.Spreadsheet] = None
+        self._admin_book: Optional[gspread.Spreadsheet] = None
         
     def _setup_logger(self) -> logging.Logger:
         """Setup logging configuration"""
@@ -54,24 +58,42 @@ class GoogleSheetsManager:
         except Exception as e:
             raise RuntimeError(f"Failed to setup Google Sheets client: {e}")
 
-    def get_worksheet_by_id_with_retry(self, spreadsheet: gspread.Spreadsheet, sheet_id: str, retries: int = 5, delay: int = 1) -> gspread.Worksheet:
-        """Get worksheet by ID with retry mechanism"""
+    def _call_with_retry(
+        self, func: Callable, *args, retries: int = 5, delay: float = 1,
+        retry_statuses: tuple = (429, 500, 502, 503, 504), **kwargs
+    ) -> Any:
+        """Call a Sheets API function, backing off exponentially on quota and server errors"""
+        # Default retry_statuses suit idempotent calls only - a 5xx may arrive after the request was applied
         for attempt in range(retries):
             try:
-                sheet = spreadsheet.get_worksheet_by_id(sheet_id)
-                if sheet:
-                    return sheet
-            except Exception as e:
-                self.logger.warning(f"Attempt {attempt + 1}/{retries} failed: {e}")
-                if attempt < retries - 1:
-                    time.sleep(delay)
-        raise RuntimeError(f"복사된 시트를 찾을 수 없습니다: sheetId={sheet_id}")
+                return func(*args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                status = e.response.status_code
+                if status not in retry_statuses or attempt == retries - 1:
+                    raise
+                wait = min(delay * 2 ** attempt, 30)
+                self.logger.warning(f"API 오류 {status}, {wait}초 후 재시도 ({attempt + 1}/{retries})")
+                time.sleep(wait)
+
+    @property
+    def response_book(self) -> gspread.Spreadsheet:
+        """Response spreadsheet, opened once and reused"""
+        if self._response_book is None:
+            self._response_book = self._call_with_retry(self.client.open_by_key, self.config.response_sheet_id)
+        return self._response_book
+
+    @property
+    def admin_book(self) -> gspread.Spreadsheet:
+        """Admin spreadsheet, opened once and reused"""
+        if self._admin_book is None:
+            self._admin_book = self._call_with_retry(self.client.open_by_key, self.config.admin_sheet_id)
+        return self._admin_book
 
     def safe_delete_sheet_by_title(self, spreadsheet: gspread.Spreadsheet, title: str) -> None:
         """Delete sheet by title if it exists"""
         try:
-            sheet = spreadsheet.worksheet(title)
-            spreadsheet.del_worksheet(sheet)
+            sheet = self._call_with_retry(spreadsheet.worksheet, title)
+            self._call_with_retry(spreadsheet.del_worksheet, sheet)
             self.logger.info(f"🗑 기존 시트 '{title}' 삭제 완료")
         except gspread.exceptions.WorksheetNotFound:
             self.logger.info(f"시트 '{title}'가 존재하지 않아 삭제를 건너뜁니다.")
@@ -83,30 +105,64 @@ class GoogleSheetsManager:
             "검토자1", "검토자2", "동", "호수", "타입", "비고","카카오톡 닉네임+uuid"
         ]
     
-    def _read_sheets(self) -> tuple[List[Dict], List[Dict], gspread.Worksheet]:
-        """Read both response and admin sheets and return their data with admin worksheet"""
+    def _values_to_df(self, values: List[List[str]]) -> pd.DataFrame:
+        """Build a DataFrame from raw sheet values, using the first row as header"""
+        if not values:
+            return pd.DataFrame()
+        return pd.DataFrame(values[1:], columns=values[0])
+    
+    def _get_sheet_values(self, spreadsheet: gspread.Spreadsheet, sheet_name: str) -> List[List[str]]:
+        """Read all values of a sheet by range, asking the API for the values field only"""
+        response = self._call_with_retry(
+            spreadsheet.values_get, absolute_range_name(sheet_name), params={"fields": "values"}
+        )
+        return fill_gaps(response.get("values", []))
+    
+    def _find_header_row(self, values: List[List[str]]) -> int:
+        """Find the 1-based header row (contains 동 and 호수) in raw sheet values"""
+        self.logger.info(f"시트 전체 구조 (처음 5행):")
+        for i, row in enumerate(values[:5], 1):
+            self.logger.info(f"  행 {i}: {row}")
+        
+        for i, row in enumerate(values):
+            if any('동' in str(cell) and '호수' in str(row) for cell in row):
+                return i + 1  # Convert to 1-based
+        
+        # Fallback to default
+        self.logger.warning("헤더 행을 찾을 수 없어 기본값(3행) 사용")
+        return 3
+    
+    def _read_sheets(self) -> tuple[pd.DataFrame, pd.DataFrame, gspread.Worksheet, int]:
+        """Read both response and admin sheets and return their data with admin worksheet and header row"""
         try:
             self.logger.info("응답 시트와 관리자 시트 열기 시작...")
             
-            # Open response sheet
-            response_sheet = self.client.open_by_key(self.config.response_sheet_id)
-            response_ws = response_sheet.worksheet(self.config.response_sheet_name)
-            response_data = response_ws.get_all_records()
-            self.logger.info(f"✅ 응답 시트 읽기 완료 - {len(response_data)}개 레코드")
+            # Open both spreadsheets first so the handles are not opened twice from threads
+            response_book, admin_book = self.response_book, self.admin_book
+            
+            # Reads are independent network round-trips - run them concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                response_future = executor.submit(self._get_sheet_values, response_book, self.config.response_sheet_name)
+                admin_future = executor.submit(self._get_sheet_values, admin_book, self.config.admin_sheet_name)
+                admin_ws_future = executor.submit(self._call_with_retry, admin_book.worksheet, self.config.admin_sheet_name)
+                response_values, admin_values, admin_ws = (
+                    response_future.result(), admin_future.result(), admin_ws_future.result()
+                )
             
-            # Open admin sheet
-            admin_sheet = self.client.open_by_key(self.config.admin_sheet_id)
-            admin_ws = admin_sheet.worksheet(self.config.admin_sheet_name)
-            admin_data = admin_ws.get_all_records()
-            self.logger.info(f"✅ 관리자 시트 읽기 완료 - {len(admin_data)}개 레코드")
+            response_df = self._values_to_df(response_values)
+            self.logger.info(f"✅ 응답 시트 읽기 완료 - {len(response_df)}개 레코드")
+            
+            header_row = self._find_header_row(admin_values)
+            admin_df = self._values_to_df(admin_values[header_row - 1:])
+            self.logger.info(f"✅ 관리자 시트 읽기 완료 - {len(admin_df)}개 레코드")
             
             # Log sample data for verification
-            if response_data:
-                self.logger.info(f"응답 시트 컬럼: {list(response_data[0].keys())}")
-            if admin_data:
-                self.logger.info(f"관리자 시트 컬럼: {list(admin_data[0].keys())}")
+            if not response_df.empty:
+                self.logger.info(f"응답 시트 컬럼: {list(response_df.columns)}")
+            if not admin_df.empty:
+                self.logger.info(f"관리자 시트 컬럼: {list(admin_df.columns)}")
             
-            return response_data, admin_data, admin_ws
+            return response_df, admin_df, admin_ws, header_row
                 
         except Exception as e:
             self.logger.error(f"❌ 시트 읽기 실패: {e}")
@@ -123,13 +179,18 @@ class GoogleSheetsManager:
             
             self.logger.info(f"관리자 시트 백업 시작: {backup_name}")
             
-            # Copy to backup
-            copied = admin_ws.copy_to(self.config.admin_sheet_id)
+            # Copy to backup - retry only on 429, which rejects the request before any copy is made
+            copied = self._call_with_retry(admin_ws.copy_to, self.config.admin_sheet_id, retry_statuses=(429,))
             
-            # Get the copied sheet and rename it
-            admin_sheet = self.client.open_by_key(self.config.admin_sheet_id)
-            copied_ws = self.get_worksheet_by_id_with_retry(admin_sheet, copied["sheetId"])
-            copied_ws.update_title(backup_name)
+            # Rename the copied sheet by the sheetId returned from copy_to
+            self._call_with_retry(self.admin_book.batch_update, {
+                "requests": [{
+                    "updateSheetProperties": {
+                        "properties": {"sheetId": copied["sheetId"], "title": backup_name},
+                        "fields": "title",
+                    }
+                }]
+            })
             
             self.logger.info(f"✅ 관리자 시트 백업 완료: {backup_name}")
             
@@ -137,11 +198,14 @@ class GoogleSheetsManager:
             self.logger.error(f"❌ 관리자 시트 백업 실패: {e}")
             raise
     
+    def _to_sheet_values(self, df: pd.DataFrame) -> List[List[str]]:
+        """Convert DataFrame (without KEY) to the 2-D string list written to the sheet"""
+        return df.drop(columns=['KEY'], errors='ignore').fillna("").astype(str).to_numpy().tolist()
+    
     def _create_key(self, df: pd.DataFrame) -> pd.DataFrame:
         """Create composite key from 동 and 호수 columns"""
-        df["KEY"] = (
-            df["동"].astype(str).str.strip() + "-" + 
-            df["호수"].astype(str).str.strip()
+        df["KEY"] = df["동"].astype("string").str.strip().str.cat(
+            df["호수"].astype("string").str.strip(), sep="-", na_rep=""
         )
         return df
     
@@ -160,68 +224,66 @@ class GoogleSheetsManager:
             "청탁 및 금품수수 금지 서약": "청탁 및 금품수수 금지 서약"
         }
     
-    def _merge_multiline_data(self, existing_value: str, new_values: List[str]) -> str:
-        """Merge existing value with new values in multiline format"""
-        all_values = []
+    def _merge_multiline_data(self, existing: pd.Series, new_values: pd.Series) -> pd.Series:
+        """Merge existing multiline cells with lists of new values, keeping first-seen order"""
+        has_new = new_values.notna()
+        existing_lines = existing[has_new].fillna('').astype(str).str.split('\n').explode()
         
-        # Add existing values if any
-        if existing_value and str(existing_value).strip():
-            existing_lines = [line.strip() for line in str(existing_value).split('\n') if line.strip()]
-            all_values.extend(existing_lines)
+        # Existing lines first, then new values, per admin row
+        lines = pd.concat([existing_lines, new_values[has_new].explode()]).sort_index(kind='stable').str.strip()
+        lines = lines[lines != '']
         
-        # Add new values
-        for value in new_values:
-            value_str = str(value).strip()
-            if value_str:
-                all_values.append(value_str)
-        
-        # Remove duplicates while preserving order
-        unique_values = []
-        seen = set()
-        for value in all_values:
-            if value not in seen:
-                unique_values.append(value)
-                seen.add(value)
+        # Remove duplicates per row while preserving order
+        merged = (
+            lines.rename_axis('row').reset_index(name='value')
+            .drop_duplicates()
+            .groupby('row', sort=False)['value']
+            .agg('\n'.join)
+        )
         
-        return '\n'.join(unique_values)
-    
-    def _extract_representatives(self, responses_for_key: List[Dict]) -> str:
-        """Extract representative members based on '세대 대표자 여부' column"""
-        representatives = []
-        for response in responses_for_key:
-            is_representative = str(response.get('세대 대표자 여부', '')).strip()
-            # Check various possible values for representative status
-            if is_representative.lower() in ['예', 'yes', 'y', 'o', '대표', 'true', '1']:
-                name = str(response.get('이름', '')).strip()
-                if name:
-                    representatives.append(name)
-        return '\n'.join(representatives) if representatives else ""
+        result = existing.astype(object)
+        result.loc[merged.index] = merged
+        return result
     
-    def _generate_uuid_from_df(self, responses_df_for_key: pd.DataFrame) -> str:
-        """Generate UUID sequence based on actual response sheet row numbers"""
-        if responses_df_for_key.empty:
-            return ""
+    def _extract_representatives(self, response_df: pd.DataFrame) -> pd.Series:
+        """Extract representative members per KEY based on '세대 대표자 여부' column"""
+        if '세대 대표자 여부' not in response_df.columns or '이름' not in response_df.columns:
+            return pd.Series(dtype=object)
         
-        # Get the actual row numbers from the DataFrame index
+        is_representative = response_df['세대 대표자 여부'].str.lower()
+        names = response_df['이름']
+        # Check various possible values for representative status
+        representatives = names[
+            is_representative.isin(['예', 'yes', 'y', 'o', '대표', 'true', '1']) & (names != '')
+        ]
+        return representatives.groupby(response_df.loc[representatives.index, 'KEY'], sort=False).agg('\n'.join)
+    
+    def _generate_uuid_from_df(self, response_df: pd.DataFrame) -> pd.Series:
+        """Generate UUID sequence per KEY based on actual response sheet row numbers"""
         # Response sheet row number = DataFrame index + 2 (assuming header in row 1, 0-based index)
-        row_numbers = []
-        for idx in responses_df_for_key.index:
-            actual_row = idx + 2  # Convert 0-based index to 1-based row number, +1 for header
-            row_numbers.append(str(actual_row))
+        row_numbers = pd.Series(response_df.index + 2, index=response_df.index).astype(str)
+        return row_numbers.groupby(response_df['KEY'], sort=False).agg('\n'.join)
+
+    def _aggregate_responses(self, response_df: pd.DataFrame, merge_cols: List[tuple]) -> pd.DataFrame:
+        """Aggregate response rows into one row per KEY, suffixed with '_new' for merging"""
+        response_agg = pd.DataFrame({
+            'uuid': self._generate_uuid_from_df(response_df),
+            '대표자 이름': self._extract_representatives(response_df),
+        })
         
-        self.logger.debug(f"UUID 생성: DataFrame indices {list(responses_df_for_key.index)} -> 행번호 {row_numbers}")
-        return '\n'.join(row_numbers)
+        # Collect non-empty values for each mapped column as a list per KEY
+        for response_col, admin_col in merge_cols:
+            values = response_df[response_col]
+            values = values[values != '']
+            response_agg[admin_col] = values.groupby(response_df.loc[values.index, 'KEY'], sort=False).agg(list)
+        
+        return response_agg.add_suffix('_new').rename_axis('KEY').reset_index()
 
-    def merge_into_admin_sheet(self, response_data, admin_data, admin_ws) -> None:
+    def merge_into_admin_sheet(self, response_df: pd.DataFrame, admin_df: pd.DataFrame, admin_ws: gspread.Worksheet, header_row: int = 3) -> None:
         """Merge response data into admin sheet"""
         try:
             self.logger.info("응답 데이터를 관리자 시트에 병합 시작...")
             
-            # Convert to DataFrames
-            response_df = pd.DataFrame(response_data)
-            admin_df = pd.DataFrame(admin_data)
-
-
             if response_df.empty:
                 self.logger.warning("⚠️ 응답 시트에 데이터가 없습니다. 병합을 건너뜁니다.")
                 return
@@ -229,60 +291,51 @@ class GoogleSheetsManager:
             self.logger.info(f"Response 컬럼: {list(response_df.columns)}")
             self.logger.info(f"Admin 컬럼: {list(admin_df.columns)}")
             
+            # Keep current admin data to skip the write when nothing changes
+            original_values = self._to_sheet_values(admin_df)
+            
             # Create keys for both dataframes
             response_df = self._create_key(response_df)
             admin_df = self._create_key(admin_df)
             
-            # Group response data by KEY (동-호수)
-            response_grouped = response_df.groupby('KEY')
-            self.logger.info(f"Response 데이터 그룹: {len(response_grouped)} 개 동호수")
-            
             column_mappings = self._get_column_mappings()
             protected_cols = self._get_protected_columns()
-
-            # Process each admin row
-            updated_count = 0
-            for i, admin_row in admin_df.iterrows():
-                key = admin_row['KEY']
-                
-                if key not in response_grouped.groups:
-                    continue
-                
-                # Get all responses for this 동호수
-                responses_df_for_key = response_grouped.get_group(key)
-                responses_for_key = responses_df_for_key.to_dict('records')
-                self.logger.info(f"동호수 {key}: {len(responses_for_key)}개 응답 처리")
-                
-                # Generate UUID sequence using actual row numbers
-                if 'uuid' in admin_df.columns:
-                    admin_df.at[i, 'uuid'] = self._generate_uuid_from_df(responses_df_for_key)
-                
-                # Extract representatives for  ID
-                if '대표자 이름' in admin_df.columns:
-                    admin_df.at[i, '대표자 이름'] = self._extract_representatives(responses_for_key)
-                
-                # Process each column mapping
-                for response_col, admin_col in column_mappings.items():
-                    if admin_col in protected_cols:
-                        self.logger.debug(f"보호된 컬럼 건너뜀: {admin_col}")
-                        continue
-                    
-                    if response_col in response_df.columns and admin_col in admin_df.columns:
-                        # Collect all values for this column from responses
-                        new_values = [str(resp.get(response_col, '')).strip() for resp in responses_for_key]
-                        new_values = [v for v in new_values if v]  # Remove empty values
-                        
-                        if new_values:
-                            existing_value = str(admin_df.at[i, admin_col]) if not pd.isna(admin_df.at[i, admin_col]) else ""
-                            merged_value = self._merge_multiline_data(existing_value, new_values)
-                            admin_df.at[i, admin_col] = merged_value
-                
-                updated_count += 1
+            merge_cols = [
+                (response_col, admin_col) for response_col, admin_col in column_mappings.items()
+                if admin_col not in protected_cols
+                and response_col in response_df.columns and admin_col in admin_df.columns
+            ]
+            
+            # Strip response values once for both the column merge and representative lookup
+            strip_cols = dict.fromkeys([*(response_col for response_col, _ in merge_cols), '이름', '세대 대표자 여부'])
+            for col in strip_cols:
+                if col in response_df.columns:
+                    response_df[col] = response_df[col].astype("string").str.strip()
+            
+            # Aggregate response data by KEY (동-호수) and join onto admin rows
+            response_agg = self._aggregate_responses(response_df, merge_cols)
+            self.logger.info(f"Response 데이터 그룹: {len(response_agg)} 개 동호수")
+            
+            admin_df = admin_df.merge(response_agg, on='KEY', how='left', validate='m:1')
+            matched = admin_df['KEY'].isin(response_agg['KEY'])
             
-            self.logger.info(f"{updated_count}개 동호수 데이터 병합 완료")
+            # Generate UUID sequence using actual row numbers
+            if 'uuid' in admin_df.columns:
+                admin_df['uuid'] = admin_df['uuid_new'].where(matched, admin_df['uuid'])
+            
+            # Extract representatives for  ID
+            if '대표자 이름' in admin_df.columns:
+                admin_df['대표자 이름'] = admin_df['대표자 이름_new'].fillna('').where(matched, admin_df['대표자 이름'])
+            
+            # Process each column mapping
+            for _, admin_col in merge_cols:
+                admin_df[admin_col] = self._merge_multiline_data(admin_df[admin_col], admin_df[f"{admin_col}_new"])
+            
+            admin_df = admin_df.drop(columns=response_agg.columns.drop('KEY'))
+            self.logger.info(f"{int(matched.sum())}개 동호수 데이터 병합 완료")
 
             # Update the sheet
-            self._update_admin_sheet(admin_df, admin_ws)
+            self._update_admin_sheet(admin_df, admin_ws, header_row, original_values)
             
         except Exception as e:
             self.logger.error(f"데이터 병합 중 오류 발생: {e}")
@@ -290,9 +343,9 @@ class GoogleSheetsManager:
     
 
     def _apply_one_time_formatting(self, admin_ws: gspread.Worksheet, start_row: int, num_rows: int, num_cols: int) -> None:
-        """One-time formatting: Apply gray background to odd rows with rate limiting"""
+        """One-time formatting: Apply gray background to odd rows in a single batch request"""
         try:
-            self.logger.info("🎨 일회성 포맷팅: 홀수 행에 회색 배경 적용 중 (170행부터 재시작)...")
+            self.logger.info("🎨 일회성 포맷팅: 홀수 행에 회색 배경 적용 중...")
             
             # Light gray color for alternating rows
             gray_format = {
@@ -303,48 +356,35 @@ class GoogleSheetsManager:
                 }
             }
             
-            # Start from row 170 to avoid rate limit issues
-            start_from_idx = max(0, 330 - start_row)
-            formatted_rows = 0
+            # Apply to odd rows (1, 3, 5, 7...) - one repeatCell request per row, sent together
+            odd_rows = [row for row in range(start_row, start_row + num_rows) if row % 2 == 1]
+            requests = [
+                {
+                    "repeatCell": {
+                        "range": {
+                            "sheetId": admin_ws.id,
+                            "startRowIndex": row - 1,
+                            "endRowIndex": row,
+                            "startColumnIndex": 0,
+                            "endColumnIndex": num_cols,
+                        },
+                        "cell": {"userEnteredFormat": gray_format},
+                        "fields": "userEnteredFormat.backgroundColor",
+                    }
+                }
+                for row in odd_rows
+            ]
             
-            for row_idx in range(start_from_idx, num_rows):
-                actual_row = start_row + row_idx
-                
-                # Apply to odd rows (1, 3, 5, 7...)
-                if actual_row % 2 == 1:
-                    start_col_letter = "A"
-                    end_col_letter = chr(ord(start_col_letter) + num_cols - 1)
-                    range_name = f"{start_col_letter}{actual_row}:{end_col_letter}{actual_row}"
-                    
-                    try:
-                        admin_ws.format(range_name, gray_format)
-                        formatted_rows += 1
-                        self.logger.info(f"회색 배경 적용: {range_name}")
-                        
-                        # Rate limiting: wait between requests
-                        time.sleep(0.1)  # 100ms delay between each format request
-                        
-                    except Exception as e:
-                        if "quota" in str(e).lower() or "limit" in str(e).lower():
-                            self.logger.warning(f"API 제한 도달, 잠시 대기 후 재시도...")
-                            time.sleep(2)  # Wait 2 seconds on quota error
-                            try:
-                                admin_ws.format(range_name, gray_format)
-                                formatted_rows += 1
-                                self.logger.info(f"재시도 성공: {range_name}")
-                            except Exception as retry_e:
-                                self.logger.error(f"재시도 실패 {range_name}: {retry_e}")
-                                break  # Stop formatting on persistent error
-                        else:
-                            self.logger.warning(f"포맷팅 실패 {range_name}: {e}")
-            
-            self.logger.info(f"✅ 일회성 포맷팅 완료: {formatted_rows}개 홀수 행에 회색 배경 적용 (170행부터)")
+            if requests:
+                self._call_with_retry(admin_ws.spreadsheet.batch_update, {"requests": requests})
+            
+            self.logger.info(f"✅ 일회성 포맷팅 완료: {len(odd_rows)}개 홀수 행에 회색 배경 적용")
             
         except Exception as e:
             self.logger.error(f"일회성 포맷팅 중 오류: {e}")
             # 포맷팅 실패해도 데이터는 정상 업데이트된 상태
 
-    def _update_admin_sheet(self, admin_df: pd.DataFrame, admin_ws: gspread.Worksheet) -> None:
+    def _update_admin_sheet(self, admin_df: pd.DataFrame, admin_ws: gspread.Worksheet, header_row: int = 3, original_values: Optional[List[List[str]]] = None) -> None:
         """Update admin sheet with merged data - use existing DataFrame structure"""
         try:
             self.logger.info("관리자 시트 업데이트 시작...")
@@ -356,56 +396,35 @@ class GoogleSheetsManager:
             self.logger.info(f"업데이트할 DataFrame 컬럼: {list(update_df.columns)}")
             if not update_df.empty:
                 self.logger.info(f"샘플 데이터 (첫번째 행):")
-                for col in update_df.columns:
-                    sample_value = update_df.iloc[0][col]
+                first_row = update_df.iloc[0]
+                for col, sample_value in first_row.items():
                     if str(sample_value).strip():  # Only log non-empty values
                         self.logger.info(f"  {col}: '{sample_value}'")
             
             # Prepare update values
-            update_values = []
-            for _, row in update_df.iterrows():
-                row_values = []
-                for col in update_df.columns:
-                    val = row[col]
-                    val_str = "" if pd.isna(val) else str(val)
-                    row_values.append(val_str)
-                update_values.append(row_values)
+            update_values = self._to_sheet_values(update_df)
             
             if not update_values:
                 self.logger.warning("업데이트할 데이터가 없습니다.")
                 return
             
-            # Calculate update range - find where data actually starts
-            # First, check the sheet structure
-            all_data = admin_ws.get_all_values()
-            self.logger.info(f"시트 전체 구조 (처음 5행):")
-            for i, row in enumerate(all_data[:5], 1):
-                self.logger.info(f"  행 {i}: {row}")
-            
-            # Find the header row (contains column names)
-            header_row_idx = None
-            for i, row in enumerate(all_data):
-                if any('동' in str(cell) and '호수' in str(all_data[i]) for cell in row):
-                    header_row_idx = i + 1  # Convert to 1-based
-                    break
-            
-            if header_row_idx is None:
-                # Fallback to default
-                header_row_idx = 3
-                self.logger.warning("헤더 행을 찾을 수 없어 기본값(3행) 사용")
+            if update_values == original_values:
+                self.logger.info("변경 사항이 없어 관리자 시트 업데이트를 건너뜁니다.")
+                return
+            
+            # Backup admin sheet before writing
+            self.backup_admin_sheet(admin_ws)
             
             # Data starts right after header
-            start_row = header_row_idx + 1
-            start_col = "A"
-            end_col = chr(ord(start_col) + len(update_df.columns) - 1)
+            start_row = header_row + 1
             end_row = start_row + len(update_values) - 1
-            range_name = f"{start_col}{start_row}:{end_col}{end_row}"
+            range_name = f"{rowcol_to_a1(start_row, 1)}:{rowcol_to_a1(end_row, len(update_df.columns))}"
             
-            self.logger.info(f"🟢 헤더 행: {header_row_idx}, 데이터 시작: {start_row}")
+            self.logger.info(f"🟢 헤더 행: {header_row}, 데이터 시작: {start_row}")
             self.logger.info(f"🟢 업데이트 범위: {range_name} ({len(update_values)}행 x {len(update_df.columns)}열)")
             
-            # Update the sheet
-            admin_ws.update(range_name=range_name, values=update_values)
+            # Update the sheet - RAW writes values verbatim, no server-side parsing
+            self._call_with_retry(admin_ws.update, range_name=range_name, values=update_values, value_input_option="RAW")
             
             # One-time formatting: Apply alternating gray colors to odd rows
             # self._apply_one_time_formatting(admin_ws, start_row, len(update_values), len(update_df.columns))
@@ -424,20 +443,16 @@ class GoogleSheetsManager:
         try:
             self.logger.info("Credentials 파일 확인 중...")
             # Test connection by opening a sheet
-            test_sheet = self.client.open_by_key(self.config.response_sheet_id)
-            self.logger.info(f"✅ Credentials 로드 성공 - 시트 '{test_sheet.title}' 접근 확인")
+            self.logger.info(f"✅ Credentials 로드 성공 - 시트 '{self.response_book.title}' 접근 확인")
         except Exception as e:
             self.logger.error(f"❌ Credentials 로드 실패: {e}")
             raise
         
         # Test reading both sheets
-        response_data, admin_data, admin_ws = self._read_sheets()
-        self.logger.info(f"시트 읽기 테스트 완료 - 응답: {len(response_data)}개, 관리자: {len(admin_data)}개 레코드")
-        
-        # Backup admin sheet before processing
-        self.backup_admin_sheet(admin_ws)
+        response_df, admin_df, admin_ws, header_row = self._read_sheets()
+        self.logger.info(f"시트 읽기 테스트 완료 - 응답: {len(response_df)}개, 관리자: {len(admin_df)}개 레코드")
         
-        self.merge_into_admin_sheet(response_data,admin_data,admin_ws)
+        self.merge_into_admin_sheet(response_df,admin_df,admin_ws,header_row)
         self.logger.info("Google Sheets 처리 완료")
 
 